@@ -43,7 +43,9 @@ Iterables are treated as big-endian.
 version = "v1.1.0"
 version_iterable = [1, 1, 0]
 
-import inspect
+import sys
+from functools import lru_cache, reduce
+from operator import and_, or_, xor
 
 
 # -- Basic Operations --
@@ -52,74 +54,65 @@ def op_and(*args):
     """Output[i] is 1 if all arg[i] equal 1, else 0."""
     _ensure_min_arg_count(2, *args)
     _ensure_same_arg_length(*args)
-    accumulator = [1] * len(args[0])
-    for arg in args:
-        accumulator = [accumulator[i] & arg[i] for i in range(len(arg))]
-    return tuple(accumulator)
+    return _unpack(reduce(and_, map(_pack, args)), len(args[0]))
 
 def op_or(*args):
     """Output[i] is 1 if any arg[i] equals 1, else 0."""
     _ensure_min_arg_count(2, *args)
     _ensure_same_arg_length(*args)
-    accumulator = [0] * len(args[0])
-    for arg in args:
-        accumulator = [accumulator[i] | arg[i] for i in range(len(arg))]
-    return tuple(accumulator)
+    return _unpack(reduce(or_, map(_pack, args)), len(args[0]))
 
 def op_xor(*args):
-    """Output[i] is 1 if exactly one arg[i] equals 1, else 0."""
+    """Output[i] is 1 if an odd number of arg[i] equal 1, else 0.
+
+    This is true bitwise XOR folded across the arguments. With two
+    arguments it matches the familiar exclusive-or truth table; with
+    more it computes parity rather than "exactly one bit set".
+    """
     _ensure_min_arg_count(2, *args)
     _ensure_same_arg_length(*args)
-    counter = [0] * len(args[0])
-    for arg in args:
-        counter = [counter[i] + arg[i] for i in range(len(arg))]
-    accumulator = [{True: 1, False: 0}[bit == 1] for bit in counter]
-    return tuple(accumulator)
+    return _unpack(reduce(xor, map(_pack, args)), len(args[0]))
 
 def op_neg(bits):
     """Return bitwise complement of bits as tuple."""
-    new_bits = [(bit + 1) % 2 for bit in bits]
-    return tuple(new_bits)
+    length = len(bits)
+    return _unpack(~_pack(bits) & _mask(length), length)
 
 def op_ls0(shift, bits):
     """Left-shift bits. Fill new bits with 0."""
     if shift < 1:
         raise ValueError("shift must be greater than 0 (given {})".format(shift))
     length = len(bits)
-    retainer_length = max(length - shift, 0)
-    accumulator = [0] * len(bits)
-    accumulator[:retainer_length] = bits[shift:]
-    return tuple(accumulator)
+    if shift >= length:
+        return _zeros(length)
+    return tuple(bits[shift:]) + _zeros(shift)
 
 def op_ls1(shift, bits):
     """Left-shift bits. Fill new bits with 1."""
     if shift < 1:
         raise ValueError("shift must be greater than 0 (given {})".format(shift))
     length = len(bits)
-    retainer_length = max(length - shift, 0)
-    accumulator = [1] * len(bits)
-    accumulator[:retainer_length] = bits[shift:]
-    return tuple(accumulator)
+    if shift >= length:
+        return _ones(length)
+    return tuple(bits[shift:]) + _ones(shift)
 
 def op_rs0(shift, bits):
     """Right-shift bits. Fill new bits with 0."""
     if shift < 1:
         raise ValueError("shift must be greater than 0 (given {})".format(shift))
     length = len(bits)
-    retainer_length = max(length - shift, 0)
-    accumulator = [0] * len(bits)
-    accumulator[shift:] = bits[:retainer_length]
-    return tuple(accumulator)
+    if shift >= length:
+        return _zeros(length)
+    return _zeros(shift) + tuple(bits[:length - shift])
 
 def op_rs1(shift, bits):
     """Right-shift bits. Fill new bits with 1."""
     if shift < 1:
         raise ValueError("shift must be greater than 0 (given {})".format(shift))
     length = len(bits)
-    retainer_length = max(length - shift, 0)
-    accumulator = [1] * len(bits)
-    accumulator[shift:] = bits[:retainer_length]
-    return tuple(accumulator)
+    if shift >= length:
+        return _ones(length)
+    return _ones(shift) + tuple(bits[:length - shift])
 
 
 # -- Math Operations --
@@ -128,10 +121,7 @@ def op_add(*args):
     """Return sum of args in tuple of same length."""
     _ensure_min_arg_count(2, *args)
     _ensure_same_arg_length(*args)
-    accumulator = [0] * len(args[0])
-    for addend in args:
-        accumulator = _add_two_values(accumulator, addend)
-    return tuple(accumulator)
+    return _op_add(*args)
 
 def op_sub(*args):
     """Return difference of args in tuple of same length.
@@ -141,56 +131,125 @@ def op_sub(*args):
     """
     _ensure_min_arg_count(2, *args)
     _ensure_same_arg_length(*args)
-    accumulator = args[0]
-    subtrahends = args[1:]
-    if not subtrahends:
-        return tuple(accumulator)
-    for subtrahend in subtrahends:
-        inverse = op_neg(subtrahend)
-        addend = op_add(inverse, _one(len(inverse)))
-        accumulator = op_add(accumulator, addend)
-    return tuple(accumulator)
+    return _op_sub(*args)
 
 def op_inc(bits):
     """Adds 1."""
-    accumulator = op_add(bits, _one(len(bits)))
-    return tuple(accumulator)
+    if len(bits) == 0:
+        raise TypeError("op_inc() requires at least one bit")
+    return _op_add(bits, _one(len(bits)))
 
 def op_dec(bits):
     """Subtracts 1."""
-    accumulator = op_sub(bits, _one(len(bits)))
-    return tuple(accumulator)
+    if len(bits) == 0:
+        raise TypeError("op_dec() requires at least one bit")
+    return _op_sub(bits, _one(len(bits)))
 
 
 # -- Conversions --
 
 def binary_to_decimal(bits):
-    count = 0
-    for i in range(len(bits)):
-        if bits[i] == 1:
-            count += 2**(len(bits) - i - 1)
-    return count
+    return _pack(bits)
 
 def decimal_to_binary(decimal, bitlength):
-    if decimal >= 2**bitlength:
+    if decimal > _mask(bitlength):
         raise ValueError(
             "decimal too high for bitlength {}: {} > {}"
-            "".format(bitlength, decimal, 2**bitlength - 1))
+            "".format(bitlength, decimal, _mask(bitlength)))
     if decimal < 0:
         raise ValueError("decimal too low: {} < 0".format(decimal))
-    bits = [0] * bitlength
-    for i in range(bitlength):
-        if decimal >= 2**(bitlength - i - 1):
-            bits[i] = 1
-            decimal -= 2**(bitlength - i - 1)
-    return tuple(bits)
+    return _unpack(decimal, bitlength)
+
+def binary_to_bytes(bits):
+    """Pack bits into bytes, 8 bits per byte, big-endian.
+
+    The last byte is padded on the right with zeros when len(bits) is
+    not a multiple of 8.
+    """
+    length = len(bits)
+    padding = -length % 8
+    value = _pack(bits) << padding
+    return value.to_bytes((length + padding) // 8, "big")
+
+def bytes_to_binary(data, bitlength):
+    """Unpack bytes from binary_to_bytes into a tuple of bits."""
+    if bitlength > len(data) * 8:
+        raise ValueError(
+            "bitlength too high for {} bytes: {} > {}"
+            "".format(len(data), bitlength, len(data) * 8))
+    value = int.from_bytes(data, "big") >> (len(data) * 8 - bitlength)
+    return _unpack(value, bitlength)
 
 
 # -- Internal utilities --
 
+@lru_cache(maxsize=None)
 def _one(length):
-    accumulator = [0] * (length - 1) + [1]
-    return tuple(accumulator)
+    return (0,) * (length - 1) + (1,)
+
+@lru_cache(maxsize=None)
+def _mask(length):
+    return (1 << length) - 1
+
+@lru_cache(maxsize=None)
+def _zeros(length):
+    return (0,) * length
+
+@lru_cache(maxsize=None)
+def _ones(length):
+    return (1,) * length
+
+_BITS_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_DIGITS_TO_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+@lru_cache(maxsize=None)
+def _digit_format(length):
+    return "0{}b".format(length)
+
+def _pack(bits):
+    """Pack a sequence of bits into a single big-endian integer."""
+    if len(bits) == 0:
+        return 0
+    return int(bytes(bits).translate(_BITS_TO_DIGITS), 2)
+
+def _unpack(value, length):
+    """Unpack a big-endian integer into a tuple of length bits."""
+    if length == 0:
+        return ()
+    digits = format(value, _digit_format(length)).encode()
+    return tuple(digits.translate(_DIGITS_TO_BITS))
+
+def _cla_add(a, b, length):
+    """Carry-lookahead sum of two packed values.
+
+    Reference implementation of the Kogge-Stone adder: generate and
+    propagate vectors are combined over log2(length) doubling steps
+    instead of rippling a carry bit per position. Returns the packed
+    pair (sum, carries) so callers can inspect the carry into each bit,
+    which op_add's plain integer addition never exposes.
+    """
+    mask = _mask(length)
+    generate = a & b
+    propagate = a ^ b
+    distance = 1
+    while distance < length:
+        generate |= propagate & (generate << distance)
+        propagate &= propagate << distance
+        distance <<= 1
+    carries = (generate << 1) & mask
+    return (a ^ b ^ carries) & mask, carries
+
+def _op_add(*args):
+    """op_add without validation. Callers guarantee the preconditions."""
+    length = len(args[0])
+    total = sum(_pack(arg) for arg in args) & _mask(length)
+    return _unpack(total, length)
+
+def _op_sub(*args):
+    """op_sub without validation. Callers guarantee the preconditions."""
+    length = len(args[0])
+    difference = _pack(args[0]) - sum(_pack(arg) for arg in args[1:])
+    return _unpack(difference & _mask(length), length)
 
 def _ensure_min_arg_count(min_count, *args):
     if len(args) < min_count:
@@ -200,31 +259,14 @@ def _ensure_min_arg_count(min_count, *args):
         )
 
 def _parent_function_name(depth=1):
-    return inspect.stack()[depth+1][3]
+    return sys._getframe(depth + 1).f_code.co_name
 
 def _ensure_same_arg_length(*args):
     """If all args have same length, exit cleanly. Else, raise TypeError."""
-    l = [len(arg) for arg in args]
-    s = set(l)
-    if len(s) == 1:
-        return
-    else:
-        raise TypeError(
-            "{}() requires arguments to have same length (lengths given: {})"
-            "".format(_parent_function_name(), l)
-        )
-
-def _add_two_values(a, b):
-    """Return sum of a and b as tuple."""
-    assert len(a) == len(b)
-    carry = 0
-    out = []
-    for i in range(len(a)):
-        index = -(i+1)
-        total = a[index] + b[index] + carry
-        out.insert(0, total % 2)
-        if total > 1:
-            carry = 1
-        else:
-            carry = 0
-    return tuple(out)
+    length = len(args[0])
+    for arg in args[1:]:
+        if len(arg) != length:
+            raise TypeError(
+                "{}() requires arguments to have same length (lengths given: {})"
+                "".format(_parent_function_name(), [len(a) for a in args])
+            )